@@ -10,22 +10,29 @@ Design Intent:
     
 Key Design Decisions:
     - Streamlit session state for conversation persistence across reruns
+    - Shared LLM client cached across reruns and sessions with
+      st.cache_resource
     - Graceful degradation when LLM unavailable (demo mode)
     - No hardcoded secrets (all config via environment variables)
-    - Minimal dependencies (3 packages total)
+    - Minimal dependencies (4 packages total)
     - Modular design enables independent testing and future extensions
 """
 
 import streamlit as st
-import json
+import orjson
 import os
+import mmap
 from pathlib import Path
+from typing import Iterator
 
 from llm import get_llm_client
 from memory import create_memory
 from personality import create_personality, PersonalityTone
 
 
+SAMPLE_CHAT_FILE = Path(__file__).parent / "data" / "sample_chat.json"
+
+
 # Page configuration
 st.set_page_config(
     page_title="GuppShupp AI Companion",
@@ -34,6 +41,32 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def load_llm_client():
+    """
+    Get the LLM client shared by all sessions.
+    
+    Design Rationale:
+        The client owns a pooled HTTP session, so building it once per process
+        avoids re-creating the session and adapters on every new session.
+    """
+    return get_llm_client()
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def ollama_available() -> bool:
+    """
+    Check Ollama availability, reusing the answer for a few seconds.
+    
+    Design Rationale:
+        Every widget interaction reruns the script; caching here collapses
+        those reruns into at most one probe per TTL window. The probe goes
+        through the shared client's pooled session and skips the client's
+        own TTL, so only this cache applies.
+    """
+    return load_llm_client().is_available(use_cache=False)
+
+
 def initialize_session_state():
     """
     Initialize Streamlit session state variables for conversation persistence.
@@ -45,7 +78,7 @@ def initialize_session_state():
         script simple while preserving state.
     """
     if "memory" not in st.session_state:
-        st.session_state.memory = create_memory(max_history=20)
+        st.session_state.memory = create_memory(max_history=20, max_content_length=2000)
     
     if "personality" not in st.session_state:
         st.session_state.personality = create_personality("friendly")
@@ -54,17 +87,40 @@ def initialize_session_state():
         st.session_state.messages = []
     
     if "llm_client" not in st.session_state:
-        st.session_state.llm_client = get_llm_client()
+        st.session_state.llm_client = load_llm_client()
+    
+    # Refreshed by the sidebar on every rerun, then reused for the chat turn
+    if "ollama_available" not in st.session_state:
+        st.session_state.ollama_available = False
+
+
+@st.cache_data(show_spinner=False)
+def parse_sample_data(path: str, mtime: float) -> list:
+    """
+    Parse a sample chat file, cached across reruns and sessions.
+    
+    Design Rationale:
+        The file is memory-mapped and handed to orjson as a memoryview, so
+        large sample files are parsed straight from the page cache without
+        first being copied into a Python bytes object.
+    
+    Args:
+        path: JSON file to parse
+        mtime: File modification time; part of the cache key so edits are picked up
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            raise ValueError(f"{path} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
 
 
 def load_sample_data():
     """Load sample chat data if available."""
-    sample_file = Path(__file__).parent / "data" / "sample_chat.json"
-    
-    if sample_file.exists():
+    if SAMPLE_CHAT_FILE.exists():
         try:
-            with open(sample_file, "r") as f:
-                return json.load(f)
+            return parse_sample_data(str(SAMPLE_CHAT_FILE), SAMPLE_CHAT_FILE.stat().st_mtime)
         except Exception as e:
             st.error(f"Error loading sample data: {e}")
     
@@ -93,10 +149,13 @@ def render_sidebar():
         
         # LLM configuration
         st.subheader("LLM Configuration")
-        ollama_status = st.session_state.llm_client.is_available()
+        ollama_status = ollama_available()
+        st.session_state.ollama_available = ollama_status
         
         if ollama_status:
             st.success("✅ Ollama connected")
+            # Load the model in the background so the first reply isn't a cold start
+            st.session_state.llm_client.warm_up_async()
         else:
             st.warning("⚠️ Ollama not available")
             st.info("Using demo mode. Install Ollama for full functionality.")
@@ -133,16 +192,16 @@ def render_sidebar():
             st.rerun()
 
 
-def generate_response(prompt: str) -> str:
+def generate_response(prompt: str) -> Iterator[str]:
     """
-    Generate a response by orchestrating LLM, memory, and personality modules.
+    Generate a streamed response by orchestrating LLM, memory, and personality modules.
     
     Design Rationale:
         This function demonstrates how the three decoupled modules work together:
         1. Memory provides conversation context
         2. Personality provides system prompt for LLM
-        3. LLM generates response (or falls back to demo mode)
-        4. Personality applies final tone styling
+        3. LLM streams response chunks (or falls back to demo mode)
+        4. Personality applies final tone styling as chunks pass through
         
         This orchestration pattern keeps modules independent while enabling
         rich functionality when combined.
@@ -151,7 +210,7 @@ def generate_response(prompt: str) -> str:
         prompt: User input
         
     Returns:
-        AI response with personality tone applied
+        Iterator of AI response chunks with personality tone applied
     """
     # Get conversation context
     context = st.session_state.memory.get_context(num_messages=5)
@@ -162,34 +221,28 @@ def generate_response(prompt: str) -> str:
     # Combine context and system prompt
     full_context = f"{system_prompt}\n\nRecent conversation:\n{context}" if context else system_prompt
     
-    # Check if Ollama is available
-    if st.session_state.llm_client.is_available():
-        # Generate response using Ollama
-        response = st.session_state.llm_client.generate(prompt, context=full_context)
+    # Reuse the availability check made by the sidebar during this rerun
+    if st.session_state.ollama_available:
+        # Stream response from Ollama
+        chunks = st.session_state.llm_client.generate_stream(prompt, context=full_context)
     else:
-        # Demo mode: provide a placeholder response
-        response = "This is a demo response. Connect to Ollama for real AI interactions!"
+        # Demo mode: provide a placeholder response as a single chunk
+        chunks = iter(["This is a demo response. Connect to Ollama for real AI interactions!"])
     
     # Apply personality tone
-    styled_response = st.session_state.personality.apply_tone(response)
-    
-    return styled_response
+    return st.session_state.personality.apply_tone_stream(chunks)
 
 
-def main():
-    """Main application entry point."""
-    # Initialize session state
-    initialize_session_state()
-    
-    # Render sidebar
-    render_sidebar()
-    
-    # Main header
-    st.title("🤖 GuppShupp AI Companion")
-    st.markdown("*Your friendly AI companion for conversations*")
-    
-    st.divider()
+def render_chat():
+    """
+    Render the conversation transcript and handle new chat turns.
     
+    Design Rationale:
+        Deliberately not an st.fragment: a chat turn must rerun the sidebar
+        so the Ollama status used by generate_response, the model warm-up,
+        and the memory stats stay current. A fragment would still redraw the
+        whole transcript, so it would save little.
+    """
     # Display chat messages
     for message in st.session_state.messages:
         role = message["role"]
@@ -208,16 +261,32 @@ def main():
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Generate and display assistant response
+        # Generate and display assistant response as it streams in
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = generate_response(prompt)
-            st.markdown(response)
+            response = st.write_stream(generate_response(prompt))
         
         # Add assistant message to chat
         st.session_state.messages.append({"role": "assistant", "content": response})
         st.session_state.memory.add_message("assistant", response)
 
 
+def main():
+    """Main application entry point."""
+    # Initialize session state
+    initialize_session_state()
+    
+    # Render sidebar
+    render_sidebar()
+    
+    # Main header
+    st.title("🤖 GuppShupp AI Companion")
+    st.markdown("*Your friendly AI companion for conversations*")
+    
+    st.divider()
+    
+    # Conversation
+    render_chat()
+
+
 if __name__ == "__main__":
     main()
@@ -11,11 +11,17 @@ Key Design Decisions:
     - Configuration via environment variables to avoid hardcoded secrets
     - Optional LLM with automatic fallback to ensure app works without Ollama
     - Specific exception handling to distinguish connection vs. other errors
+    - Pooled keep-alive session so repeated calls reuse one connection
 """
 
 import os
+import time
+import threading
+import orjson
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 
 class OllamaClient:
@@ -29,6 +35,16 @@ class OllamaClient:
         both production and demo/development scenarios.
     """
     
+    # Seconds an is_available() result is reused before probing again
+    AVAILABILITY_TTL = 5.0
+    # Pooled connections kept per host; also caps generate_batch concurrency
+    POOL_MAXSIZE = 8
+    # Pause between mock response chunks in generate_stream so demo mode
+    # streams visibly in the UI
+    MOCK_CHUNK_DELAY = 0.01
+    # How long Ollama keeps the model resident after warm_up
+    WARMUP_KEEP_ALIVE = "30m"
+    
     def __init__(self, base_url: Optional[str] = None, model: str = "mistral"):
         """
         Initialize Ollama client with configurable endpoint.
@@ -43,7 +59,22 @@ class OllamaClient:
         """
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         # Allow model override via environment. Default to "mistral" (smaller than llama2).
-        self.model = os.getenv("OLLAMA_MODEL", model)
+        # This is the single place the OLLAMA_MODEL override is resolved.
+        self.model = os.getenv("OLLAMA_MODEL") or model
+
+        # One keep-alive session per client so every call reuses pooled sockets
+        # instead of opening a fresh connection to Ollama.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.POOL_MAXSIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
+        self._available: Optional[bool] = None
+        self._available_checked_at = 0.0
+
+        self._warmup_started = False
+        self._warmup_lock = threading.Lock()
         
     def generate(self, prompt: str, context: Optional[str] = None) -> str:
         """
@@ -53,6 +84,9 @@ class OllamaClient:
             Returns error messages as strings rather than raising exceptions,
             allowing the UI to display meaningful feedback to users when LLM
             is unavailable. This keeps the application functional in degraded mode.
+            Built on top of generate_iter so every path shares one request flow.
+            A stream that breaks before its done chunk falls back to the mock
+            response rather than returning a truncated reply as if complete.
         
         Args:
             prompt: User input prompt
@@ -61,33 +95,191 @@ class OllamaClient:
         Returns:
             Generated response text or user-friendly error message
         """
+        parts = []
+        done = False
+        for text, done in self.generate_iter(prompt, context=context):
+            parts.append(text)
+        
+        if not done:
+            # Stream ended early → mock response, never a partial reply
+            return self.mock_response(prompt)
+        return "".join(parts)
+
+    def generate_stream(self, prompt: str, context: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream only the response text, e.g. for st.write_stream.
+        
+        Design Rationale:
+            This is the UI path, so the mock fallback is paced by
+            MOCK_CHUNK_DELAY to stream visibly like a live model. generate_iter
+            and generate never sleep.
+        
+        Args:
+            prompt: User input prompt
+            context: Optional context to include (for conversation continuity)
+            
+        Yields:
+            Non-empty response text fragments in generation order
+        """
+        for text, _ in self._iter_chunks(prompt, context, mock_delay=self.MOCK_CHUNK_DELAY):
+            if text:
+                yield text
+
+    def generate_iter(self, prompt: str, context: Optional[str] = None) -> Iterator[Tuple[str, bool]]:
+        """
+        Stream a response from the LLM chunk by chunk as Ollama decodes it.
+        
+        Design Rationale:
+            Yielding text as soon as Ollama emits it lets callers render or
+            post-process tokens incrementally, so perceived latency drops to
+            time-to-first-token instead of full generation time. The done flag
+            lets non-UI consumers (scripts, evals, SSE endpoints) detect the end
+            of a reply without knowing Ollama's wire format. Only the connect
+            phase has a timeout so long generations are not cut off. Errors
+            before the first chunk fall back to the mock response, streamed
+            in word-sized chunks without any pacing delay.
+        
+        Args:
+            prompt: User input prompt
+            context: Optional context to include (for conversation continuity)
+            
+        Yields:
+            (text, done) tuples in generation order; done is True on the final
+            chunk. Iteration ends without a done chunk if the stream breaks.
+        """
+        return self._iter_chunks(prompt, context, mock_delay=0.0)
+
+    def _iter_chunks(
+        self, prompt: str, context: Optional[str], mock_delay: float
+    ) -> Iterator[Tuple[str, bool]]:
+        """Shared streaming implementation; mock_delay paces the mock fallback."""
+        started = False
         try:
             full_prompt = f"{context}\n\n{prompt}" if context else prompt
 
-            response = requests.post(
+            with self._session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
                     "prompt": full_prompt,
-                    "stream": False
+                    "stream": True
                 },
-                timeout=30
-            )
+                stream=True,
+                timeout=(5, None)
+            ) as response:
+                if response.status_code != 200:
+                    # Non-200 → fall back to mock response so UI never crashes
+                    yield from self._mock_iter(prompt, mock_delay)
+                    return
 
-            if response.status_code == 200:
-                return response.json().get("response", "")
-            else:
-                # Non-200 → fall back to mock response so UI never crashes
-                return self.mock_response(prompt)
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    text = chunk.get("response", "")
+                    done = bool(chunk.get("done"))
+                    if text:
+                        started = True
+                    yield text, done
+                    if done:
+                        break
 
         except requests.exceptions.ConnectionError:
-            # Service not reachable → mock response
-            return self.mock_response(prompt)
+            # Service not reachable → mock response (unless already streaming)
+            if not started:
+                yield from self._mock_iter(prompt, mock_delay)
         except Exception:
-            # Any other error → mock response
-            return self.mock_response(prompt)
+            # Any other error → mock response (unless already streaming)
+            if not started:
+                yield from self._mock_iter(prompt, mock_delay)
+
+    def _mock_iter(self, prompt: str, delay: float) -> Iterator[Tuple[str, bool]]:
+        """Stream the mock response word by word, pausing `delay` seconds between words."""
+        words = self.mock_response(prompt).split(" ")
+        last = len(words) - 1
+        for i, word in enumerate(words):
+            if i == last:
+                yield word, True
+            else:
+                yield word + " ", False
+                if delay:
+                    time.sleep(delay)
+    
+    def generate_batch(self, prompts: List[str], context: Optional[str] = None) -> List[str]:
+        """
+        Generate responses for several prompts with overlapping requests.
+        
+        Design Rationale:
+            Dispatches the prompts concurrently over the pooled session instead
+            of one after another, so Ollama can work on them in parallel (up to
+            its OLLAMA_NUM_PARALLEL setting). Uses threads rather than an async
+            HTTP client to avoid adding a dependency. Each prompt degrades to
+            the mock response independently, like generate.
+        
+        Args:
+            prompts: User input prompts
+            context: Optional context shared by every prompt
+            
+        Returns:
+            Generated responses in the same order as prompts
+        """
+        if not prompts:
+            return []
+
+        workers = min(len(prompts), self.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda p: self.generate(p, context=context), prompts))
     
-    def is_available(self) -> bool:
+    def warm_up(self) -> bool:
+        """
+        Ask Ollama to load the model into memory ahead of the first real request.
+        
+        Design Rationale:
+            Ollama loads model weights lazily, so otherwise the first user turn
+            pays the whole load time. A one-token generation with a long
+            keep_alive loads the model and keeps it resident. Failures never
+            raise because the real request will simply pay the load instead.
+        
+        Returns:
+            True if Ollama accepted the warm-up request, False otherwise
+        """
+        try:
+            response = self._session.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": " ",
+                    "stream": False,
+                    "keep_alive": self.WARMUP_KEEP_ALIVE,
+                    "options": {"num_predict": 1}
+                },
+                timeout=(5, None)
+            )
+            response.close()
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def warm_up_async(self) -> None:
+        """
+        Run warm_up in a background thread, at most once per client.
+        
+        A failed warm-up clears the guard so a later call can retry; the
+        client is shared process-wide, so one failure must not disable it.
+        """
+        with self._warmup_lock:
+            if self._warmup_started:
+                return
+            self._warmup_started = True
+        threading.Thread(target=self._warm_up_or_reset, daemon=True).start()
+
+    def _warm_up_or_reset(self) -> None:
+        """Warm up, allowing a retry if it did not succeed."""
+        if not self.warm_up():
+            with self._warmup_lock:
+                self._warmup_started = False
+    
+    def is_available(self, use_cache: bool = True) -> bool:
         """
         Check if Ollama service is available without raising exceptions.
         
@@ -95,15 +287,33 @@ class OllamaClient:
             Provides a simple boolean check to enable conditional logic in the
             UI (e.g., showing demo mode vs. full LLM functionality). Catches all
             exceptions to ensure the check never crashes the application.
+            The result is reused for AVAILABILITY_TTL seconds because Streamlit
+            calls this on every rerun.
+        
+        Args:
+            use_cache: Reuse a result younger than AVAILABILITY_TTL; pass False
+                when the caller does its own caching
         
         Returns:
             True if Ollama is running and accessible, False otherwise
         """
+        now = time.monotonic()
+        if (
+            use_cache
+            and self._available is not None
+            and now - self._available_checked_at < self.AVAILABILITY_TTL
+        ):
+            return self._available
+
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
+            available = response.status_code == 200
         except Exception:
-            return False
+            available = False
+
+        self._available = available
+        self._available_checked_at = now
+        return available
 
     def mock_response(self, prompt: str, context: Optional[str] = None) -> str:
         """
@@ -156,6 +366,5 @@ def get_llm_client(model: str = "mistral") -> OllamaClient:
     Returns:
         Configured OllamaClient instance
     """
-    # Respect environment override even if a model is passed
-    env_model = os.getenv("OLLAMA_MODEL")
-    return OllamaClient(model=env_model or model)
+    # OllamaClient applies the OLLAMA_MODEL override even if a model is passed
+    return OllamaClient(model=model)
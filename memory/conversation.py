@@ -15,8 +15,15 @@ Key Design Decisions:
     - Timestamp tracking for potential future time-aware features
 """
 
-from typing import List, Dict, Any
-from datetime import datetime
+import re
+import time
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Any, Deque, Optional
+
+
+# Runs of six or more letters count as candidate topics
+_TOPIC_WORD = re.compile(r"[^\W\d_]{6,}")
 
 
 class ConversationMemory:
@@ -30,20 +37,31 @@ class ConversationMemory:
         testing easier.
     """
     
-    def __init__(self, max_history: int = 10):
+    def __init__(self, max_history: int = 10, max_content_length: Optional[int] = None):
         """
         Initialize conversation memory with bounded storage.
         
         Design Rationale:
             Limits history size to prevent unbounded memory growth while
             keeping recent context for meaningful conversations. The sliding
-            window approach is simple and predictable.
+            window is a bounded deque, so old messages drop off in O(1)
+            instead of re-slicing the list on every insert. Capping how much
+            of each message goes into the context keeps the per-turn prompt
+            size bounded even when individual messages are very long.
         
         Args:
             max_history: Maximum number of messages to keep in history
+            max_content_length: Maximum characters of each message included in
+                get_context (None for no limit). History keeps the full text.
         """
         self.max_history = max_history
-        self.history: List[Dict[str, Any]] = []
+        self.max_content_length = max_content_length
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
+        # "Role: content" lines kept in step with history so get_context
+        # only has to join them
+        self._formatted: Deque[str] = deque(maxlen=max_history)
+        # Cached extract_topics() result, reset when user messages change
+        self._topics: Optional[List[str]] = None
         
     def add_message(self, role: str, content: str) -> None:
         """
@@ -56,13 +74,29 @@ class ConversationMemory:
         message = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            # Epoch seconds; format with datetime.fromtimestamp() when needed
+            "timestamp": time.time()
         }
+        # Topics only depend on user messages: drop the cache when one is
+        # added or about to be evicted
+        evicting_user = (
+            bool(self.history)
+            and len(self.history) == self.history.maxlen
+            and self.history[0]["role"] == "user"
+        )
+        if role == "user" or evicting_user:
+            self._topics = None
+        
+        # Bounded deques evict the oldest message once full
         self.history.append(message)
-        
-        # Keep only recent history
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+        self._formatted.append(f"{role.capitalize()}: {self._clip(content)}")
+    
+    def _clip(self, content: str) -> str:
+        """Truncate content to max_content_length for use in the context."""
+        limit = self.max_content_length
+        if limit is None or len(content) <= limit:
+            return content
+        return content[:limit] + "…"
     
     def get_context(self, num_messages: int = 5) -> str:
         """
@@ -74,15 +108,8 @@ class ConversationMemory:
         Returns:
             Formatted context string
         """
-        recent = self.history[-num_messages:] if self.history else []
-        context_parts = []
-        
-        for msg in recent:
-            role = msg["role"].capitalize()
-            content = msg["content"]
-            context_parts.append(f"{role}: {content}")
-        
-        return "\n".join(context_parts)
+        start = max(0, len(self._formatted) - num_messages)
+        return "\n".join(islice(self._formatted, start, None))
     
     def extract_topics(self) -> List[str]:
         """
@@ -92,23 +119,34 @@ class ConversationMemory:
             Uses placeholder logic (word length filtering) to demonstrate the
             concept without adding NLP library dependencies. This keeps the
             project minimal while showing where advanced topic modeling could
-            be added in the future.
+            be added in the future. Topics come back in first-seen order, the
+            scan stops once five are found, and the result is cached until the
+            user messages in history change.
         
         Returns:
             List of identified topics (currently simple keyword extraction)
         """
+        if self._topics is None:
+            self._topics = self._scan_topics(limit=5)
+        return list(self._topics)
+
+    def _scan_topics(self, limit: int) -> List[str]:
+        """Collect up to `limit` unique long words from user messages, in order."""
         # Placeholder: In a real implementation, this would use NLP/LLM
         # to extract meaningful topics from the conversation
-        topics = []
+        seen: Dict[str, None] = {}
         
         for msg in self.history:
-            if msg["role"] == "user":
-                # Simple keyword extraction (placeholder)
-                words = msg["content"].lower().split()
-                topics.extend([w for w in words if len(w) > 5])
-        
-        # Return unique topics
-        return list(set(topics))[:5]
+            if msg["role"] != "user":
+                continue
+            # Simple keyword extraction (placeholder)
+            for word in _TOPIC_WORD.findall(msg["content"].lower()):
+                if word not in seen:
+                    seen[word] = None
+                    if len(seen) == limit:
+                        return list(seen)
+        
+        return list(seen)
     
     def get_summary(self) -> str:
         """
@@ -136,17 +174,20 @@ class ConversationMemory:
     
     def clear(self) -> None:
         """Clear all conversation history."""
-        self.history = []
+        self.history.clear()
+        self._formatted.clear()
+        self._topics = None
 
 
-def create_memory(max_history: int = 10) -> ConversationMemory:
+def create_memory(max_history: int = 10, max_content_length: Optional[int] = None) -> ConversationMemory:
     """
     Factory function to create a conversation memory instance.
     
     Args:
         max_history: Maximum messages to keep
+        max_content_length: Maximum characters per message in the context (None for no limit)
         
     Returns:
         ConversationMemory instance
     """
-    return ConversationMemory(max_history=max_history)
+    return ConversationMemory(max_history=max_history, max_content_length=max_content_length)
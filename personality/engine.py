@@ -16,9 +16,14 @@ Key Design Decisions:
     - Trait-based approach allows easy customization and extension
 """
 
-from typing import Dict, Any
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Mapping
 from enum import Enum
 
+__all__ = ["PersonalityTone", "PersonalityEngine", "create_personality"]
+
 
 class PersonalityTone(Enum):
     """Available personality tones."""
@@ -29,6 +34,61 @@ class PersonalityTone(Enum):
     ENTHUSIASTIC = "enthusiastic"
 
 
+# Tone lookup by value, so resolving a name never goes through Enum.__call__
+_TONE_BY_NAME: Dict[str, PersonalityTone] = {tone.value: tone for tone in PersonalityTone}
+
+
+def _frozen_traits(traits: Dict[str, str]) -> Mapping[str, str]:
+    """Intern ASCII trait strings and wrap them in a read-only mapping."""
+    return MappingProxyType({
+        key: sys.intern(value) if value.isascii() else value
+        for key, value in traits.items()
+    })
+
+
+# Trait templates per tone. Built once at import; inner mappings are
+# read-only so engines can share them safely.
+_TRAIT_MAP: Mapping[PersonalityTone, Mapping[str, str]] = {
+    PersonalityTone.FRIENDLY: _frozen_traits({
+        "style": "warm and approachable",
+        "greeting": "Hey there!",
+        "prefix": "I'd be happy to help! ",
+        "suffix": " 😊"
+    }),
+    PersonalityTone.PROFESSIONAL: _frozen_traits({
+        "style": "formal and precise",
+        "greeting": "Hello,",
+        "prefix": "Certainly. ",
+        "suffix": ""
+    }),
+    PersonalityTone.CASUAL: _frozen_traits({
+        "style": "relaxed and informal",
+        "greeting": "Hey!",
+        "prefix": "Sure thing! ",
+        "suffix": " 👍"
+    }),
+    PersonalityTone.EMPATHETIC: _frozen_traits({
+        "style": "understanding and supportive",
+        "greeting": "Hello friend,",
+        "prefix": "I understand. ",
+        "suffix": " 💙"
+    }),
+    PersonalityTone.ENTHUSIASTIC: _frozen_traits({
+        "style": "energetic and excited",
+        "greeting": "Hi there!",
+        "prefix": "Awesome question! ",
+        "suffix": " ✨"
+    })
+}
+
+# System prompt per tone, formatted once from the traits above
+_SYSTEM_PROMPT_MAP: Mapping[PersonalityTone, str] = {
+    tone: f"You are a {traits['style']} AI companion. Respond in a {tone.value} manner."
+    for tone, traits in _TRAIT_MAP.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
 class PersonalityEngine:
     """
     Manages AI companion personality and response tone through trait-based styling.
@@ -37,24 +97,57 @@ class PersonalityEngine:
         Applies consistent personality traits to responses without requiring LLM
         processing. This keeps personality application fast, predictable, and
         completely independent of the LLM module, enabling personality changes
-        without regenerating content.
+        without regenerating content. Engines are immutable values determined
+        by their tone, so they can be shared, hashed, and used as cache keys;
+        use with_tone to switch personality.
     """
     
-    def __init__(self, tone: PersonalityTone = PersonalityTone.FRIENDLY):
+    tone: PersonalityTone = PersonalityTone.FRIENDLY
+    # Derived from tone in __post_init__; excluded from init, repr and equality
+    traits: Mapping[str, str] = field(init=False, repr=False, compare=False)
+    _prefix: str = field(init=False, repr=False, compare=False)
+    _suffix: str = field(init=False, repr=False, compare=False)
+    _greeting_with_space: str = field(init=False, repr=False, compare=False)
+    _system_prompt: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
         """
-        Initialize personality engine with a specific tone.
+        Precompute traits and derived strings for the selected tone.
         
         Design Rationale:
             Precomputes traits for the selected tone to make runtime application
             fast. Defaults to FRIENDLY tone to ensure welcoming user experience.
+            The system prompt and individual traits only depend on the tone, so
+            they are resolved into plain attributes once instead of being looked
+            up on every chat turn. object.__setattr__ is needed because the
+            dataclass is frozen.
+        """
+        traits = self._get_traits()
+        derived = {
+            "traits": traits,
+            "_prefix": traits['prefix'],
+            "_suffix": traits['suffix'],
+            "_greeting_with_space": traits['greeting'] + " ",
+            "_system_prompt": _SYSTEM_PROMPT_MAP.get(
+                self.tone, _SYSTEM_PROMPT_MAP[PersonalityTone.FRIENDLY]
+            ),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
         
-        Args:
-            tone: Personality tone to use (from PersonalityTone enum)
+    def __reduce__(self):
         """
-        self.tone = tone
-        self.traits = self._get_traits()
+        Pickle and copy engines by tone alone.
         
-    def _get_traits(self) -> Dict[str, str]:
+        Design Rationale:
+            The derived fields hold read-only mappingproxy trait views, which
+            cannot be pickled. An engine is fully determined by its tone, so
+            it is rebuilt from that instead. This keeps engines usable in
+            Streamlit session state serialization and st.cache_data.
+        """
+        return (PersonalityEngine, (self.tone,))
+
+    def _get_traits(self) -> Mapping[str, str]:
         """
         Get personality traits for current tone from predefined templates.
         
@@ -62,43 +155,13 @@ class PersonalityEngine:
             Uses hardcoded trait mappings to avoid LLM dependency for personality.
             This makes personality application instant and deterministic, while
             keeping all trait definitions in one place for easy maintenance.
+            The mappings live in the module-level _TRAIT_MAP, so this is a
+            single lookup rather than rebuilding the table per call.
         
         Returns:
             Dictionary of personality traits (style, greeting, prefix, suffix)
         """
-        trait_map = {
-            PersonalityTone.FRIENDLY: {
-                "style": "warm and approachable",
-                "greeting": "Hey there!",
-                "prefix": "I'd be happy to help! ",
-                "suffix": " 😊"
-            },
-            PersonalityTone.PROFESSIONAL: {
-                "style": "formal and precise",
-                "greeting": "Hello,",
-                "prefix": "Certainly. ",
-                "suffix": ""
-            },
-            PersonalityTone.CASUAL: {
-                "style": "relaxed and informal",
-                "greeting": "Hey!",
-                "prefix": "Sure thing! ",
-                "suffix": " 👍"
-            },
-            PersonalityTone.EMPATHETIC: {
-                "style": "understanding and supportive",
-                "greeting": "Hello friend,",
-                "prefix": "I understand. ",
-                "suffix": " 💙"
-            },
-            PersonalityTone.ENTHUSIASTIC: {
-                "style": "energetic and excited",
-                "greeting": "Hi there!",
-                "prefix": "Awesome question! ",
-                "suffix": " ✨"
-            }
-        }
-        return trait_map.get(self.tone, trait_map[PersonalityTone.FRIENDLY])
+        return _TRAIT_MAP.get(self.tone, _TRAIT_MAP[PersonalityTone.FRIENDLY])
     
     def apply_tone(self, response: str, is_greeting: bool = False) -> str:
         """
@@ -107,7 +170,9 @@ class PersonalityEngine:
         Design Rationale:
             Uses simple prefix/suffix addition rather than LLM rewriting to keep
             the operation fast, predictable, and independent of LLM availability.
-            This ensures personality works even in demo mode.
+            This ensures personality works even in demo mode. Kept as a thin
+            dispatcher for compatibility; callers that know which format they
+            need can call apply_greeting or apply_response directly.
         
         Args:
             response: Original response text
@@ -116,17 +181,69 @@ class PersonalityEngine:
         Returns:
             Response with personality tone applied
         """
-        if is_greeting:
-            return f"{self.traits['greeting']} {response}"
+        return self.apply_greeting(response) if is_greeting else self.apply_response(response)
+
+    def apply_greeting(self, response: str) -> str:
+        """
+        Prepend the tone's greeting to a response.
         
-        # Apply prefix for first interaction or add subtle tone
-        if not response.strip():
-            return response
+        Args:
+            response: Original response text
             
-        # Add personality prefix and suffix
-        styled_response = f"{self.traits['prefix']}{response}{self.traits['suffix']}"
-        return styled_response
-    
+        Returns:
+            Response introduced by the personality greeting
+        """
+        return self._greeting_with_space + response
+
+    def apply_response(self, response: str) -> str:
+        """
+        Wrap a regular response in the tone's prefix and suffix.
+        
+        Args:
+            response: Original response text
+            
+        Returns:
+            Styled response, or the input unchanged if it is empty or whitespace
+        """
+        if not response or response.isspace():
+            return response
+        
+        # Add personality prefix and suffix in a single join
+        return "".join((self._prefix, response, self._suffix))
+
+    def apply_tone_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Apply personality tone to a streamed response without buffering it.
+
+        Design Rationale:
+            Mirrors apply_response for incrementally generated text: the prefix is
+            emitted with the first non-whitespace chunk and the suffix after
+            the last one. Leading whitespace is held back so an empty or
+            whitespace-only stream is passed through unstyled, as apply_response does.
+
+        Args:
+            chunks: Response text fragments in order
+
+        Yields:
+            Styled response fragments
+        """
+        pending = []
+        started = False
+
+        for chunk in chunks:
+            if started:
+                yield chunk
+            elif chunk and not chunk.isspace():
+                started = True
+                yield "".join((self._prefix, *pending, chunk))
+            else:
+                pending.append(chunk)
+
+        if started:
+            yield self._suffix
+        elif pending:
+            yield "".join(pending)
+
     def get_system_prompt(self) -> str:
         """
         Get system prompt describing the personality for LLM context.
@@ -139,32 +256,54 @@ class PersonalityEngine:
         Returns:
             System prompt string describing the personality traits
         """
-        return f"You are a {self.traits['style']} AI companion. Respond in a {self.tone.value} manner."
+        return self._system_prompt
     
-    def set_tone(self, tone: PersonalityTone) -> None:
+    def with_tone(self, tone: PersonalityTone) -> "PersonalityEngine":
         """
-        Change the personality tone.
+        Get the engine for another tone.
         
         Args:
-            tone: New personality tone
+            tone: Personality tone to switch to
+            
+        Returns:
+            Shared PersonalityEngine instance for the tone
+        """
+        return create_personality(tone.value)
+
+    def set_tone(self, tone: PersonalityTone) -> None:
         """
-        self.tone = tone
-        self.traits = self._get_traits()
+        Removed: engines are immutable; use with_tone instead.
+        
+        Kept only to fail loudly for callers of the old in-place API rather
+        than silently leaving the tone unchanged.
+        
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError("PersonalityEngine is immutable; use engine = engine.with_tone(tone)")
+
+
+# One shared engine per tone, built once at import
+_ENGINES: Dict[PersonalityTone, PersonalityEngine] = {
+    tone: PersonalityEngine(tone=tone) for tone in PersonalityTone
+}
 
 
 def create_personality(tone: str = "friendly") -> PersonalityEngine:
     """
-    Factory function to create a personality engine.
+    Factory function to get the personality engine for a tone.
+    
+    Design Rationale:
+        Engines are fully determined by their tone, so the factory returns a
+        shared instance per tone instead of constructing a new one per call.
+        Engines are immutable, so sharing them is safe.
     
     Args:
         tone: Personality tone name
         
     Returns:
-        PersonalityEngine instance
+        Shared PersonalityEngine instance for the tone
     """
-    try:
-        tone_enum = PersonalityTone(tone.lower())
-    except ValueError:
-        tone_enum = PersonalityTone.FRIENDLY
-    
-    return PersonalityEngine(tone=tone_enum)
+    # Exact match first to skip lower() for the usual already-lowercase names
+    tone_enum = _TONE_BY_NAME.get(tone) or _TONE_BY_NAME.get(tone.lower(), PersonalityTone.FRIENDLY)
+    return _ENGINES[tone_enum]